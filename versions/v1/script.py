@@ -1,21 +1,159 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import soupsieve
 import json
 import re
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse, urljoin, urlsplit, urlunsplit
 import os
 import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from contextlib import contextmanager
 from datetime import datetime
 
+# Optional: pyahocorasick (one-pass multi-keyword matching)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional: orjson (faster JSON encode/decode, falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # File for storing custom selectors
 CUSTOM_FILE = 'custom_selectors.json'
 
+# Shared HTTP session: keep-alive + connection pooling across page and subpage fetches
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'})
+
+# Pages larger than this are handed to lxml as raw bytes so libxml2 does the decoding
+LARGE_PAGE_BYTES = 1_000_000
+# Page bodies are cut off at this size: every extractor's cost grows with the document
+MAX_PAGE_BYTES = 2_000_000
+
+# Concurrency: NGO sites are scraped in parallel, but each host only ever
+# sees a couple of requests at a time
+MAX_WORKERS = 16
+HOST_CONCURRENCY = 2
+HOST_RATE = 2.0  # requests per second per host, in bursts of up to HOST_CONCURRENCY
+
+# Keep-alive pools sized to the concurrency above: one pool per host a worker may
+# be talking to (site + linked PDF/subpage host), each holding as many warm
+# connections as that host is ever allowed to use at once
+_adapter = HTTPAdapter(pool_connections=2 * MAX_WORKERS, pool_maxsize=HOST_CONCURRENCY,
+                       max_retries=Retry(total=2, backoff_factor=0.3))
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+_host_next_slot = {}
+_host_rate_lock = threading.Lock()
+
+@lru_cache(maxsize=1024)
+def get_domain(url):
+    """Return the URL's netloc, cached since the same URLs are looked up repeatedly."""
+    return urlparse(url).netloc
+
+def host_semaphore(url):
+    """Return the semaphore that caps concurrent requests to the URL's host."""
+    host = get_domain(url)
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(HOST_CONCURRENCY)
+        return _host_semaphores[host]
+
+def wait_for_host_rate(url):
+    """Token bucket per host: sleep just long enough to keep it under HOST_RATE requests per second."""
+    host = get_domain(url)
+    interval = 1.0 / HOST_RATE
+    with _host_rate_lock:
+        now = time.monotonic()
+        # Next slot on the host's schedule; a burst of HOST_CONCURRENCY may run ahead of it
+        slot = max(_host_next_slot.get(host, now), now)
+        delay = slot - now - (HOST_CONCURRENCY - 1) * interval
+        _host_next_slot[host] = slot + interval
+    if delay > 0:
+        time.sleep(delay)
+
+@contextmanager
+def host_slot(url):
+    """Hold one of the host's request slots, paced by its rate limit, for the duration of a request."""
+    with host_semaphore(url):
+        wait_for_host_rate(url)
+        yield
+
+# Precompiled regex patterns (compiled once at import, reused for every page)
+YEAR_PATTERNS = [
+    re.compile(r'(?:founded|established|started)\s*(?:in|on)?\s*(\d{4})', re.IGNORECASE),
+    re.compile(r'year\s*(?:founded|established):\s*(\d{4})', re.IGNORECASE),
+    re.compile(r'since\s*(\d{4})', re.IGNORECASE)
+]
+FOUR_DIGIT_RE = re.compile(r'\d{4}')
+ABOUT_SECTION_RE = re.compile(r'(about\s*us|our\s*story|history)', re.IGNORECASE)
+CONTACT_SECTION_RE = re.compile(r'contact\s*us|get in touch', re.IGNORECASE)
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.[\w]+')
+PHONE_RE = re.compile(r'(?:\+?\d{1,3}[-.\s]?)?(?:\(?\d{3}\)?[-.\s]?)?\d{3,4}[-.\s]?\d{4}')  # More flexible
+# Address: house number, up to 7 words and a street suffix on a single line. Every
+# repetition is bounded and words/separators can't overlap, so matching stays linear
+ADDRESS_RE = re.compile(r'\b\d{1,5}[ \t]+[A-Za-z][\w\-.]{0,40}(?:[ \t]+[A-Za-z][\w\-.]{0,40}){0,6}[ \t]+(?:street|st|avenue|ave|road|rd|blvd|boulevard|lane|ln|marg|path|way)\b[^\n]{0,80}', re.IGNORECASE)
+# Regex for common countries/regions (non-exhaustive)
+COUNTRY_RE = re.compile(r'\b(India|United States|USA|UK|Canada|Australia|Africa|Asia|Europe|Latin America|Middle East|Brazil|China|France|Germany|Japan|Mexico|Nigeria|South Africa|Kenya|Ethiopia|Uganda)\b', re.IGNORECASE)
+
+# Section keywords, combined so one tree walk finds any of them
+FIELDS_SECTION_RE = re.compile(r'(fields of work|areas of focus|our work|programs|initiatives|what we do)', re.IGNORECASE)
+AREAS_SECTION_RE = re.compile(r'(operational areas|where we work|locations|countries|regions|our reach)', re.IGNORECASE)
+
+def keyword_matcher(keywords):
+    """Build a function that checks a lowercased text for any of the keywords in a single scan."""
+    keywords = [k.lower() for k in keywords]
+    if not AHOCORASICK_AVAILABLE:
+        return lambda text: any(k in text for k in keywords)
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return lambda text: next(automaton.iter(text), None) is not None
+
+# Subpage link keywords (lowercase, matched against lowercased link text)
+ABOUT_LINK_KWS = ('about', 'about us', 'our story', 'history', 'who we are', 'mission')
+CONTACT_LINK_KWS = ('contact', 'contact us', 'get in touch', 'reach us')
+ABOUT_LINK_MATCHER = keyword_matcher(ABOUT_LINK_KWS)
+CONTACT_LINK_MATCHER = keyword_matcher(CONTACT_LINK_KWS)
+
+# Fallback fields of work, matched in one pass over the lowercased page text
+COMMON_FIELDS = ['education', 'health', 'environment', 'poverty alleviation', 'women empowerment', 'child welfare', 'human rights', 'disaster relief', 'animal welfare']
+COMMON_FIELDS_RE = re.compile(r'\b(' + '|'.join(re.escape(f) for f in COMMON_FIELDS) + r')\b')
+
+def json_loads(data):
+    """Parse JSON from str/bytes, using orjson when available."""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def write_json(obj, filename):
+    """Write obj to filename as indented JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w') as f:
+            f.write(json.dumps(obj, indent=2))
+
 def load_custom_selectors():
     """Load custom selectors from JSON file if it exists."""
     if os.path.exists(CUSTOM_FILE):
         try:
-            with open(CUSTOM_FILE, 'r') as f:
-                return json.load(f)
+            with open(CUSTOM_FILE, 'rb') as f:
+                return json_loads(f.read())
         except json.JSONDecodeError:
             print("Invalid custom selectors file. Starting fresh.")
             return {}
@@ -23,38 +161,92 @@ def load_custom_selectors():
 
 def save_custom_selectors(customs):
     """Save custom selectors to JSON file."""
-    with open(CUSTOM_FILE, 'w') as f:
-        json.dump(customs, f, indent=4)
+    write_json(customs, CUSTOM_FILE)
+
+def normalize_url(url):
+    """Cache key for a URL: lowercase scheme/host, no fragment or trailing slash."""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), parts.query, ''))
+
+def fetch_page(url, cache=None):
+    """Fetch the webpage and return BeautifulSoup object.
+
+    cache is a dict owned by one site's scrape (its about and contact links are often
+    the same page); successful fetches are stored in it, failures are not.
+    """
+    key = normalize_url(url)
+    if cache is not None and key in cache:
+        return cache[key]
+    soup = download_page(url)
+    if cache is not None and soup is not None:
+        cache[key] = soup
+    return soup
+
+def read_markup(response):
+    """Read a streamed response body, stopping at MAX_PAGE_BYTES.
 
-def fetch_page(url):
-    """Fetch the webpage content and return BeautifulSoup object."""
-    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'}
+    Large bodies, and those without a charset in Content-Type, stay bytes so lxml
+    decodes them (honouring any <meta charset>).
+    """
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=65536):
+        body += chunk
+        if len(body) >= MAX_PAGE_BYTES:
+            del body[MAX_PAGE_BYTES:]
+            break
+    body = bytes(body)
+    if len(body) > LARGE_PAGE_BYTES or 'charset' not in response.headers.get('Content-Type', '').lower():
+        return body
+    try:
+        return body.decode(response.encoding, errors='replace')
+    except LookupError:
+        return body
+
+def download_page(url):
+    """Download the webpage content and return BeautifulSoup object."""
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        if response.status_code == 200:
-            return BeautifulSoup(response.text, 'html.parser')
-        else:
-            print(f"Failed to fetch {url}: Status code {response.status_code}")
-            return None
+        with host_slot(url), SESSION.get(url, stream=True, timeout=10) as response:
+            if response.status_code != 200:
+                print(f"Failed to fetch {url}: Status code {response.status_code}")
+                return None
+            markup = read_markup(response)
+        return BeautifulSoup(markup, 'lxml')
     except Exception as e:
         print(f"Error fetching {url}: {e}")
         return None
 
-def find_and_fetch_subpage(main_soup, base_url, keywords):
-    """Find a link matching keywords and fetch the subpage."""
+def find_subpage_links(main_soup, base_url):
+    """Walk the page's links once and return the first about-like and contact-like subpage URLs."""
+    base_key = normalize_url(base_url)
+    links = {'about': None, 'contact': None}
+    matchers = (('about', ABOUT_LINK_MATCHER), ('contact', CONTACT_LINK_MATCHER))
     for a in main_soup.find_all('a', href=True):
         text = a.text.strip().lower()
-        if any(k.lower() in text for k in keywords):
-            href = a['href']
-            sub_url = urljoin(base_url, href)
-            print(f"Found potential subpage: {sub_url}")
-            return fetch_page(sub_url), sub_url
-    return None, None
+        for kind, link_matcher in matchers:
+            if links[kind] is None and link_matcher(text):
+                sub_url = urljoin(base_url, a['href'])
+                if normalize_url(sub_url) != base_key:
+                    links[kind] = sub_url
+        if links['about'] and links['contact']:
+            break
+    return links
+
+def fetch_subpage(sub_url, cache=None):
+    """Fetch a subpage found by find_subpage_links (None if there was no link)."""
+    if not sub_url:
+        return None
+    print(f"Found potential subpage: {sub_url}")
+    return fetch_page(sub_url, cache)
+
+@lru_cache(maxsize=256)
+def compile_selector(selector):
+    """Compile a CSS selector once; custom and scope selectors are reused on every page."""
+    return soupsieve.compile(selector)
 
 def extract_ngo_name(soup, custom_selector=None):
     """Extract NGO name using custom selector or defaults."""
     if custom_selector:
-        elem = soup.select_one(custom_selector)
+        elem = compile_selector(custom_selector).select_one(soup)
         if elem:
             return elem.text.strip()
     
@@ -66,120 +258,155 @@ def extract_ngo_name(soup, custom_selector=None):
         return h1.text.strip()
     return None
 
-def extract_year_founded(soup, custom_selector=None):
-    """Extract year founded using custom selector or keyword patterns."""
+# Page regions where each field usually lives; the whole page text is scanned only when none exist
+YEAR_SCOPE = 'main, article, section, footer, [class*="about"], [id*="about"]'
+CONTACT_SCOPE = 'footer, [class*="contact"], [id*="contact"], address'
+
+def find_year(text):
+    """Return the first plausible founding year in text, trying YEAR_PATTERNS in priority order."""
+    current_year = datetime.now().year
+    for pattern in YEAR_PATTERNS:
+        match = pattern.search(text)
+        if match and 1900 <= int(match.group(1)) <= current_year:
+            return match.group(1)
+    return None
+
+def scan_text(text):
+    """Search text once per field: first year/email/phone and every country name.
+    
+    parse_page runs this once on the page text and shares the result between extractors.
+    """
+    email_match = EMAIL_RE.search(text)
+    phone_match = PHONE_RE.search(text)
+    return {
+        'year': find_year(text),
+        'email': email_match.group(0) if email_match else None,
+        'phone': phone_match.group(0) if phone_match else None,
+        'countries': set(COUNTRY_RE.findall(text))
+    }
+
+def scoped_text(soup, selector, text=None):
+    """Return the text of the outermost elements matching selector, or the full page text if none match."""
+    nodes = compile_selector(selector).select(soup)
+    selected = {id(n) for n in nodes}
+    outermost = [n for n in nodes if not any(id(p) in selected for p in n.parents)]
+    if outermost:
+        return ' '.join(n.get_text() for n in outermost)
+    return text if text is not None else soup.get_text()
+
+def extract_year_founded(soup, text=None, custom_selector=None, hits=None):
+    """Extract year founded using custom selector or keyword patterns.
+    
+    `text` is the pre-computed page text (soup.get_text()), computed here if not given,
+    and `hits` its scan_text() result, reused when the whole page is the scope.
+    Only likely regions (see YEAR_SCOPE) are searched; the whole page only if the page has none.
+    """
     if custom_selector:
-        elem = soup.select_one(custom_selector)
-        if elem:
-            text = elem.text
-        else:
-            text = ''
+        elem = compile_selector(custom_selector).select_one(soup)
+        scope = elem.text if elem else ''
     else:
-        text = soup.get_text()
+        scope = scoped_text(soup, YEAR_SCOPE, text)
+    
+    year = hits['year'] if hits is not None and scope is text else find_year(scope)
+    if year:
+        return year
     
-    # Regex patterns for year
-    patterns = [
-        r'(?:founded|established|started)\s*(?:in|on)?\s*(\d{4})',
-        r'year\s*(?:founded|established):\s*(\d{4})',
-        r'since\s*(\d{4})'
-    ]
     current_year = datetime.now().year
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            year = int(match.group(1))
-            if 1900 <= year <= current_year:
-                return str(year)
     
     # Alternative: Look in 'About Us' section
-    about_sections = soup.find_all(text=re.compile(r'(about\s*us|our\s*story|history)', re.IGNORECASE))
+    about_sections = soup.find_all(string=ABOUT_SECTION_RE)
     for section in about_sections:
         parent = section.find_parent(['div', 'section', 'p'])
         if parent:
-            matches = re.findall(r'\d{4}', parent.text)
+            matches = FOUR_DIGIT_RE.findall(parent.text)
             for m in matches:
                 year = int(m)
                 if 1900 <= year <= current_year:
                     return str(year)
     return None
 
-def extract_fields_of_work(soup, custom_selector=None):
+def extract_fields_of_work(soup, text=None, custom_selector=None):
     """Extract fields of work using custom selector or heuristics."""
     if custom_selector:
-        elems = soup.select(custom_selector)
+        elems = compile_selector(custom_selector).select(soup)
         if elems:
             return [elem.text.strip() for elem in elems if elem.text.strip()]
     
-    # Heuristics: Find sections with keywords and lists
-    keywords = ['fields of work', 'areas of focus', 'our work', 'programs', 'initiatives', 'what we do']
-    for keyword in keywords:
-        section = soup.find(text=re.compile(keyword, re.IGNORECASE))
-        if section:
+    if text is None:
+        text = soup.get_text()
+    # Heuristics: Find sections with keywords and lists (the tree is only walked
+    # when the page text contains a keyword at all)
+    if FIELDS_SECTION_RE.search(text):
+        # First few hits only, and each enclosing block is searched for a list once
+        tried = set()
+        for section in soup.find_all(string=FIELDS_SECTION_RE, limit=5):
             parent = section.find_parent(['div', 'section'])
-            if parent:
+            if parent and id(parent) not in tried:
+                tried.add(id(parent))
                 lis = parent.find_all('li')
                 if lis:
                     return [li.text.strip() for li in lis if li.text.strip()]
     # Fallback: Common fields if mentioned
-    text = soup.get_text().lower()
-    common_fields = ['education', 'health', 'environment', 'poverty alleviation', 'women empowerment', 'child welfare', 'human rights', 'disaster relief', 'animal welfare']
-    found = [field for field in common_fields if field in text]
+    matched = set(COMMON_FIELDS_RE.findall(text.lower()))
+    found = [field for field in COMMON_FIELDS if field in matched]
     return found if found else []
 
-def extract_operational_areas(soup, custom_selector=None):
+def extract_operational_areas(soup, text=None, custom_selector=None, hits=None):
     """Extract operational areas using custom selector or heuristics."""
     if custom_selector:
-        elems = soup.select(custom_selector)
+        elems = compile_selector(custom_selector).select(soup)
         if elems:
             return [elem.text.strip() for elem in elems if elem.text.strip()]
     
-    # Heuristics: Find sections with keywords like 'where we work'
-    keywords = ['operational areas', 'where we work', 'locations', 'countries', 'regions', 'our reach']
-    for keyword in keywords:
-        section = soup.find(text=re.compile(keyword, re.IGNORECASE))
-        if section:
+    if text is None:
+        text = soup.get_text()
+    # Heuristics: Find sections with keywords like 'where we work' (tree walked only on a text hit)
+    if AREAS_SECTION_RE.search(text):
+        # First few hits only, and each enclosing block is searched for a list once
+        tried = set()
+        for section in soup.find_all(string=AREAS_SECTION_RE, limit=5):
             parent = section.find_parent(['div', 'section'])
-            if parent:
+            if parent and id(parent) not in tried:
+                tried.add(id(parent))
                 lis = parent.find_all('li')
                 if lis:
                     return [li.text.strip() for li in lis if li.text.strip()]
     # Fallback: Look for country/region names (expanded list)
-    text = soup.get_text()
-    # Regex for common countries/regions (non-exhaustive)
-    country_pattern = r'\b(India|United States|USA|UK|Canada|Australia|Africa|Asia|Europe|Latin America|Middle East|Brazil|China|France|Germany|Japan|Mexico|Nigeria|South Africa|Kenya|Ethiopia|Uganda)\b'
-    countries = re.findall(country_pattern, text, re.IGNORECASE)
-    return list(set(countries)) if countries else []
-
-def extract_contact_info(soup, custom_selector=None):
-    """Extract contact info using custom selector or patterns."""
+    countries = hits['countries'] if hits is not None else set(COUNTRY_RE.findall(text))
+    return list(countries) if countries else []
+
+def extract_contact_info(soup, text=None, custom_selector=None, hits=None):
+    """Extract contact info using custom selector or patterns.
+    
+    `hits` is the page text's scan_text() result, reused when the whole page is the scope.
+    Only likely regions (see CONTACT_SCOPE) are searched; the whole page only if the page has none.
+    """
     contact = {}
     if custom_selector:
-        elem = soup.select_one(custom_selector)
-        if elem:
-            text = elem.text
-        else:
-            text = ''
+        elem = compile_selector(custom_selector).select_one(soup)
+        scope = elem.text if elem else ''
     else:
-        text = soup.get_text()
+        scope = scoped_text(soup, CONTACT_SCOPE, text)
+    
+    if hits is None or scope is not text:
+        hits = scan_text(scope)
     
     # Email
-    email_match = re.search(r'[\w\.-]+@[\w\.-]+\.[\w]+', text)
-    if email_match:
-        contact['email'] = email_match.group(0)
+    if hits['email']:
+        contact['email'] = hits['email']
     
     # Phone
-    phone_match = re.search(r'(?:\+?\d{1,3}[-.\s]?)?(?:\(?\d{3}\)?[-.\s]?)?\d{3,4}[-.\s]?\d{4}', text)  # More flexible
-    if phone_match:
-        contact['phone'] = phone_match.group(0)
+    if hits['phone']:
+        contact['phone'] = hits['phone']
     
-    # Address: More general heuristic
-    address_match = re.search(r'\d{1,5}\s+[\w\s]+(?:street|st|avenue|ave|road|rd|blvd|boulevard|lane|ln|marg|path|way)?\b.*?(?:,\s*[\w\s]+(?:\d{5})?)?', text, re.IGNORECASE | re.DOTALL)
+    # Address: number + street suffix on one line
+    address_match = ADDRESS_RE.search(scope)
     if address_match:
-        contact['address'] = address_match.group(0).strip().replace('\n', ' ')
+        contact['address'] = address_match.group(0).strip()
     
     # Alternative: Look in 'Contact Us' section or links
     if not contact:
-        contact_sections = soup.find_all(text=re.compile(r'contact\s*us|get in touch', re.IGNORECASE))
+        contact_sections = soup.find_all(string=CONTACT_SECTION_RE)
         for section in contact_sections:
             parent = section.find_parent(['div', 'section', 'footer'])
             if parent:
@@ -191,27 +418,31 @@ def extract_contact_info(soup, custom_selector=None):
                         contact['phone'] = a['href'].replace('tel:', '')
                 # Fallback regex on parent text
                 parent_text = parent.get_text()
-                email_match = re.search(r'[\w\.-]+@[\w\.-]+\.[\w]+', parent_text)
+                email_match = EMAIL_RE.search(parent_text)
                 if email_match:
                     contact['email'] = email_match.group(0)
-                phone_match = re.search(r'(?:\+?\d{1,3}[-.\s]?)?(?:\(?\d{3}\)?[-.\s]?)?\d{3,4}[-.\s]?\d{4}', parent_text)
+                phone_match = PHONE_RE.search(parent_text)
                 if phone_match:
                     contact['phone'] = phone_match.group(0)
     
     return contact if contact else None
 
-def parse_page(main_soup, url, customs):
+def parse_page(main_soup, url, customs, cache=None):
     """Parse the page(s) to extract all required information, fetching subpages if needed."""
-    domain = urlparse(url).netloc
+    domain = get_domain(url)
     custom = customs.get(domain, {})
     
+    # Page text and its regex hits are computed once and shared by all extractors
+    page_text = main_soup.get_text()
+    page_hits = scan_text(page_text)
+    
     # Initial extraction from main page
     data = {
         'ngo_name': extract_ngo_name(main_soup, custom.get('ngo_name')),
-        'year_founded': extract_year_founded(main_soup, custom.get('year_founded')),
-        'fields_of_work': extract_fields_of_work(main_soup, custom.get('fields_of_work')),
-        'operational_areas': extract_operational_areas(main_soup, custom.get('operational_areas')),
-        'contact_info': extract_contact_info(main_soup, custom.get('contact_info')),
+        'year_founded': extract_year_founded(main_soup, page_text, custom.get('year_founded'), page_hits),
+        'fields_of_work': extract_fields_of_work(main_soup, page_text, custom.get('fields_of_work')),
+        'operational_areas': extract_operational_areas(main_soup, page_text, custom.get('operational_areas'), page_hits),
+        'contact_info': extract_contact_info(main_soup, page_text, custom.get('contact_info'), page_hits),
         'website_url': url
     }
     
@@ -222,42 +453,55 @@ def parse_page(main_soup, url, customs):
     
     print(f"Initial missing info for {url}: {missing}")
     
+    # One pass over the links finds both subpage candidates
+    links = find_subpage_links(main_soup, url)
+    
     # Fetch about-like subpage if relevant fields missing
     about_fields = ['year_founded', 'fields_of_work', 'operational_areas']
     if any(f in missing for f in about_fields):
-        about_keywords = ['about', 'about us', 'our story', 'history', 'who we are', 'mission']
-        about_soup, _ = find_and_fetch_subpage(main_soup, url, about_keywords)
+        about_soup = fetch_subpage(links['about'], cache)
         if about_soup:
+            about_text = about_soup.get_text()
             for field in about_fields:
                 if field in missing:
                     if field == 'year_founded':
-                        val = extract_year_founded(about_soup, custom.get(field))
+                        val = extract_year_founded(about_soup, about_text, custom.get(field))
                     elif field == 'fields_of_work':
-                        val = extract_fields_of_work(about_soup, custom.get(field))
+                        val = extract_fields_of_work(about_soup, about_text, custom.get(field))
                     elif field == 'operational_areas':
-                        val = extract_operational_areas(about_soup, custom.get(field))
+                        val = extract_operational_areas(about_soup, about_text, custom.get(field))
                     if val:
                         data[field] = val
                         missing.remove(field)
     
     # Fetch contact subpage if still missing
     if 'contact_info' in missing:
-        contact_keywords = ['contact', 'contact us', 'get in touch', 'reach us']
-        contact_soup, _ = find_and_fetch_subpage(main_soup, url, contact_keywords)
+        contact_soup = fetch_subpage(links['contact'], cache)
         if contact_soup:
-            val = extract_contact_info(contact_soup, custom.get('contact_info'))
+            val = extract_contact_info(contact_soup, custom_selector=custom.get('contact_info'))
             if val:
                 data['contact_info'] = val
                 missing.remove('contact_info')
     
     return data
 
+def scrape_url(url, customs):
+    """Fetch and parse a single NGO site. Returns (main_soup, data) or (None, None)."""
+    cache = {}  # pages of this site only, released when the scrape finishes
+    main_soup = fetch_page(url, cache)
+    if not main_soup:
+        return None, None
+    return main_soup, parse_page(main_soup, url, customs, cache)
+
 def save_to_json(data, filename):
     """Save extracted data to JSON file."""
-    with open(filename, 'w') as f:
-        json.dump(data, f, indent=4)
+    write_json(data, filename)
     print(f"Data saved to {filename}")
 
+def output_filename(url):
+    """JSON file a site's data is saved to, named after its domain."""
+    return f"{get_domain(url).replace('www.', '')}.json"
+
 def handle_feedback(soup, url, data, customs, no_feedback=False):
     """Handle user feedback for missing information and retry."""
     missing = [k for k, v in data.items() if not v and k != 'website_url']
@@ -287,12 +531,12 @@ def handle_feedback(soup, url, data, customs, no_feedback=False):
         }
         
         if field in extract_map:
-            new_val = extract_map[field](soup, selector)
+            new_val = extract_map[field](soup, custom_selector=selector)
             if new_val:
                 print(f"Found with new selector: {new_val}")
                 update = input("Update and save this selector? (y/n): ").strip().lower()
                 if update == 'y':
-                    domain = urlparse(url).netloc
+                    domain = get_domain(url)
                     if domain not in customs:
                         customs[domain] = {}
                     customs[domain][field] = selector
@@ -309,18 +553,32 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Scrape key information from NGO websites.")
     parser.add_argument('urls', nargs='+', help="URLs of NGO websites to scrape")
     parser.add_argument('--no-feedback', action='store_true', help="Run without interactive feedback")
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS, help="Number of sites scraped in parallel")
     args = parser.parse_args()
     
     customs = load_custom_selectors()
     
-    for url in args.urls:
-        main_soup = fetch_page(url)
-        if not main_soup:
-            continue
-        
-        data = parse_page(main_soup, url, customs)
-        data = handle_feedback(main_soup, url, data, customs, args.no_feedback)
-        
-        domain = urlparse(url).netloc.replace('www.', '')
-        filename = f"{domain}.json"
-        save_to_json(data, filename)
+    # Fetch and parse all sites in parallel. Without feedback each result is saved as it
+    # arrives; otherwise results are held until every worker is done, so the workers'
+    # progress prints can't land in the middle of the interactive prompts
+    scraped = []
+    with ThreadPoolExecutor(max_workers=max(1, min(args.workers, len(args.urls)))) as ex:
+        futures = {ex.submit(scrape_url, url, customs): url for url in args.urls}
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                main_soup, data = future.result()
+            except Exception as e:
+                print(f"Error scraping {url}: {e}")
+                continue
+            if not main_soup:
+                continue
+            if args.no_feedback:
+                save_to_json(data, output_filename(url))
+            else:
+                scraped.append((url, main_soup, data))
+    
+    # Feedback prompts and saving stay on the main thread
+    for url, main_soup, data in scraped:
+        data = handle_feedback(main_soup, url, data, customs)
+        save_to_json(data, output_filename(url))
@@ -3,15 +3,27 @@
 # Fixes: Year founded, clean fields, JS sites, PDF reports
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import soupsieve
 import json
 import re
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse, urljoin, urlsplit, urlunsplit
 import os
 import argparse
+import threading
 import time
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from contextlib import contextmanager
+from itertools import islice
 import pdfplumber
-import tempfile
+from pdfplumber.page import Page
+from pdfminer.pdfpage import PDFPage
+import io
+import shutil
 from datetime import datetime
 
 # Optional: Playwright
@@ -21,55 +33,256 @@ try:
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+# Optional: selectolax (fast C parser for the link scan)
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# pyahocorasick (optional)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# orjson (optional, stdlib json otherwise)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # File for custom selectors
 CUSTOM_FILE = 'custom_selectors.json'
 
+# Shared HTTP session: keep-alive + connection pooling across page, subpage and PDF fetches
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
+
+# Big pages go to lxml as bytes (libxml2 decodes them)
+LARGE_PAGE_BYTES = 1_000_000
+# Bodies are truncated here before parsing
+MAX_PAGE_BYTES = 2_000_000
+
+# Parallel sites, but only a couple of requests per host at a time
+MAX_WORKERS = 16
+HOST_CONCURRENCY = 2
+HOST_RATE = 2.0  # requests per second per host, in bursts of up to HOST_CONCURRENCY
+
+# Connection pools sized from the limits above
+_adapter = HTTPAdapter(pool_connections=2 * MAX_WORKERS, pool_maxsize=HOST_CONCURRENCY,
+                       max_retries=Retry(total=2, backoff_factor=0.3))
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+_host_next_slot = {}
+_host_rate_lock = threading.Lock()
+
+# netloc of a URL (cached, looked up for every fetch)
+@lru_cache(maxsize=1024)
+def get_domain(url):
+    return urlparse(url).netloc
+
+# Per-host semaphore, created on first use
+def host_semaphore(url):
+    host = get_domain(url)
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(HOST_CONCURRENCY)
+        return _host_semaphores[host]
+
+# Sleep until the host's next HOST_RATE slot is due
+def wait_for_host_rate(url):
+    host = get_domain(url)
+    interval = 1.0 / HOST_RATE
+    with _host_rate_lock:
+        now = time.monotonic()
+        # HOST_CONCURRENCY requests may go out ahead of the schedule
+        slot = max(_host_next_slot.get(host, now), now)
+        delay = slot - now - (HOST_CONCURRENCY - 1) * interval
+        _host_next_slot[host] = slot + interval
+    if delay > 0:
+        time.sleep(delay)
+
+# Wrap every request to a host: concurrency cap + rate limit
+@contextmanager
+def host_slot(url):
+    with host_semaphore(url):
+        wait_for_host_rate(url)
+        yield
+
+# Regexes, compiled at import
+YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+YEAR_PATTERNS = (
+    re.compile(r'(?:founded|established|started|since)\s*(?:in)?\s*(19|20)\d{2}', re.I),
+    re.compile(r'\b(19|20)\d{2}\s*(?:founded|established)', re.I)
+)
+PDF_YEAR_RE = re.compile(r'(?:founded|established|since)\s*(?:in)?\s*(\d{4})', re.I)
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+# Phone: optional country code, then 2-4 / 3-4 / 3-5 digit groups. The lookarounds stop
+# it matching inside longer digit runs (IDs, analytics snippets)
+PHONE_RE = re.compile(r'(?<![\d])(?:\+?\d{1,3}[-.\s]?)?\(?\d{2,4}\)?[-.\s]?\d{3,4}[-.\s]?\d{3,5}(?![\d])')
+COUNTRY_RE = re.compile(r'\b(India|Delhi|Mumbai|Pune|Odisha|Maharashtra|Karnataka|Tamil Nadu|USA|UK|Africa|Asia)\b', re.I)
+
+# Program-list keywords, combined so one tree walk finds any of them
+FIELDS_SECTION_RE = re.compile(r'program|initiative|project|work|focus', re.I)
+
+# JSON helpers (orjson when available)
+def json_loads(data):
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def write_json(obj, filename):
+    if ORJSON_AVAILABLE:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w') as f:
+            f.write(json.dumps(obj, indent=2))
+
 # Load/save custom selectors
 def load_custom_selectors():
     if os.path.exists(CUSTOM_FILE):
         try:
-            with open(CUSTOM_FILE, 'r') as f:
-                return json.load(f)
+            with open(CUSTOM_FILE, 'rb') as f:
+                return json_loads(f.read())
         except:
             return {}
     return {}
 
 def save_custom_selectors(customs):
-    with open(CUSTOM_FILE, 'w') as f:
-        json.dump(customs, f, indent=4)
+    write_json(customs, CUSTOM_FILE)
 
 # === 1. FETCH PAGE (Playwright or Requests) ===
-def fetch_page(url, use_playwright=False):
+# Dedup/cache key: lowercase scheme/host, no fragment or trailing slash
+def normalize_url(url):
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), parts.query, ''))
+
+def fetch_page(url, use_playwright=False, cache=None):
+    return fetch_page_and_markup(url, use_playwright, cache)[0]
+
+# Returns (soup, raw markup); the markup feeds the selectolax link scan.
+# cache is a dict owned by one NGO's parse_ngo; failed fetches are not stored
+def fetch_page_and_markup(url, use_playwright=False, cache=None):
+    key = normalize_url(url)
+    if cache is not None and key in cache:
+        return cache[key]
+    page = download_page(url, use_playwright)
+    if cache is not None and page[0] is not None:
+        cache[key] = page
+    return page
+
+# Playwright objects are tied to the thread that created them, so each browser is
+# owned by its own dedicated thread for the whole run; a queue of idle threads caps
+# how many pages render at once (one fresh context per page)
+PLAYWRIGHT_BROWSERS = 2
+_playwright_threads = [ThreadPoolExecutor(max_workers=1, thread_name_prefix='playwright')
+                       for _ in range(PLAYWRIGHT_BROWSERS)]
+_idle_playwright_threads = queue.Queue()
+for _thread in _playwright_threads:
+    _idle_playwright_threads.put(_thread)
+_playwright_local = threading.local()
+
+def _render(url):
+    local = _playwright_local
+    if getattr(local, 'browser', None) is None:
+        local.playwright = sync_playwright().start()
+        local.browser = local.playwright.chromium.launch(headless=True)
+    context = local.browser.new_context()
+    try:
+        page = context.new_page()
+        page.goto(url, wait_until="domcontentloaded", timeout=15000)
+        try:
+            page.wait_for_selector('main, article, #content, footer', timeout=3000)
+        except Exception:
+            pass
+        return page.content()
+    finally:
+        context.close()
+
+def _close_browser():
+    local = _playwright_local
+    if getattr(local, 'browser', None) is not None:
+        local.browser.close()
+        local.playwright.stop()
+        local.browser = local.playwright = None
+
+# Render on the next idle browser thread; blocks while all are busy
+def render_page(url):
+    thread = _idle_playwright_threads.get()
+    try:
+        return thread.submit(_render, url).result()
+    finally:
+        _idle_playwright_threads.put(thread)
+
+# Close every started browser on its own thread, then stop the threads
+def shutdown_browser():
+    for thread in _playwright_threads:
+        thread.submit(_close_browser).result()
+        thread.shutdown()
+
+# Body capped at MAX_PAGE_BYTES; bytes if large or charset-less, so lxml decodes it
+def read_markup(response):
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=65536):
+        body += chunk
+        if len(body) >= MAX_PAGE_BYTES:
+            del body[MAX_PAGE_BYTES:]
+            break
+    body = bytes(body)
+    if len(body) > LARGE_PAGE_BYTES or 'charset' not in response.headers.get('Content-Type', '').lower():
+        return body
+    try:
+        return body.decode(response.encoding, errors='replace')
+    except LookupError:
+        return body
+
+def download_page(url, use_playwright=False):
     if use_playwright and PLAYWRIGHT_AVAILABLE:
         print(f"Using Playwright to render {url}")
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until="networkidle", timeout=30000)
-            html = page.content()
-            browser.close()
-            return BeautifulSoup(html, 'html.parser')
+        try:
+            with host_slot(url):
+                html = render_page(url)
+            return BeautifulSoup(html, 'lxml'), html
+        except:
+            return None, None
     else:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
         try:
-            response = requests.get(url, headers=headers, timeout=15)
-            if response.status_code == 200:
-                return BeautifulSoup(response.text, 'html.parser')
+            with host_slot(url), SESSION.get(url, stream=True, timeout=15) as response:
+                if response.status_code != 200:
+                    return None, None
+                markup = read_markup(response)
+            return BeautifulSoup(markup, 'lxml'), markup
         except:
             pass
-        return None
+        return None, None
 
 # === 2. JSON-LD PARSING (schema.org) ===
+ORG_TYPES = frozenset({'NGO', 'Organization', 'Nonprofit', 'NonprofitOrganization'})
+# Every organization @type contains one of these, so scripts without them can skip json parsing
+ORG_HINT_RE = re.compile(r'NGO|Organization|Nonprofit')
+
+def is_org(item):
+    types = item.get('@type')
+    types = types if isinstance(types, list) else [types]
+    return not ORG_TYPES.isdisjoint(types)
+
 def extract_from_json_ld(soup):
     data = {}
     scripts = soup.find_all('script', type='application/ld+json')
     for script in scripts:
+        if not script.string or not ORG_HINT_RE.search(script.string):
+            continue
         try:
-            json_data = json.loads(script.string)
+            json_data = json_loads(script.string)
             # Handle both dict and list
             items = json_data if isinstance(json_data, list) else [json_data]
             for item in items:
-                if item.get('@type') in ['NGO', 'Organization', 'Nonprofit']:
+                if is_org(item):
                     if 'foundingDate' in item:
                         data['year_founded'] = item['foundingDate'][:4]
                     if 'name' in item:
@@ -94,24 +307,62 @@ def extract_from_json_ld(soup):
     return data
 
 # === 3. PDF TEXT EXTRACTION ===
+# Founding years sit near the start of most reports: fetch only the head first
+# and the rest of the file only if the head has no year
+PDF_HEAD_BYTES = 512 * 1024
+PDF_MAX_PAGES = 10
+
+def download_pdf(pdf_url, buf, first_byte=0, last_byte=''):
+    # Stream a byte range into an in-memory buffer; pdfplumber reads file-like objects directly.
+    # Returns True once buf holds the whole file, None on failure
+    headers = {'Range': f'bytes={first_byte}-{last_byte}', 'Accept-Encoding': 'identity'}
+    with host_slot(pdf_url), SESSION.get(pdf_url, headers=headers, stream=True, timeout=15) as response:
+        if response.status_code == 200:
+            first_byte = 0  # server ignored Range and sent the whole file
+        elif response.status_code != 206:
+            return None
+        buf.seek(first_byte)
+        buf.truncate()
+        response.raw.decode_content = True
+        shutil.copyfileobj(response.raw, buf)
+        total = response.headers.get('Content-Range', '').rpartition('/')[2]
+        return response.status_code == 200 or (total.isdigit() and buf.tell() >= int(total))
+
+def scan_pdf(buf, texts):
+    # Look for year page by page, stopping at the first hit. Pages are created one at a
+    # time, so a cut-off head still yields its first pages; those already in texts are
+    # skipped, and nothing past PDF_MAX_PAGES is read
+    buf.seek(0)
+    with pdfplumber.open(buf) as pdf:
+        page_objs = islice(PDFPage.create_pages(pdf.doc), len(texts), PDF_MAX_PAGES)
+        for number, page_obj in enumerate(page_objs, len(texts) + 1):
+            texts.append(Page(pdf, page_obj, page_number=number).extract_text() or "")
+            year_match = PDF_YEAR_RE.search(texts[-1])
+            if year_match:
+                return year_match
+
+    # The phrase may straddle a page break
+    return PDF_YEAR_RE.search("".join(texts))
+
 def extract_from_pdf(pdf_url):
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-            response = requests.get(pdf_url, timeout=15)
-            if response.status_code != 200:
-                return {}
-            tmp.write(response.content)
-            tmp_path = tmp.name
-
-        text = ""
-        with pdfplumber.open(tmp_path) as pdf:
-            for page in pdf.pages:
-                text += page.extract_text() or ""
-
-        os.unlink(tmp_path)
-
-        # Look for year
-        year_match = re.search(r'(?:founded|established|since)\s*(?:in)?\s*(\d{4})', text, re.I)
+        buf = io.BytesIO()
+        complete = download_pdf(pdf_url, buf, 0, PDF_HEAD_BYTES - 1)
+        if complete is None:
+            return {}
+
+        texts = []  # text of the pages scanned so far
+        try:
+            year_match = scan_pdf(buf, texts)
+        except:
+            year_match = None  # a cut-off head may not parse on its own
+        if not year_match and not complete:
+            del texts[-1:]  # the head's last page may have been cut off, so read it again
+            if len(texts) < PDF_MAX_PAGES:
+                if download_pdf(pdf_url, buf, PDF_HEAD_BYTES) is None:
+                    return {}
+                year_match = scan_pdf(buf, texts)
+
         if year_match:
             return {'year_founded': year_match.group(1)}
     except:
@@ -119,85 +370,132 @@ def extract_from_pdf(pdf_url):
     return {}
 
 # === 4. SUBPAGE & PDF DISCOVERY ===
-def find_subpages_and_pdfs(soup, base_url):
-    subpages = []
-    pdfs = []
-
-    for a in soup.find_all('a', href=True):
-        href = a['href']
-        text = a.get_text(strip=True).lower()
+# One-scan "any keyword in lowercased text?" check (Aho-Corasick if installed)
+def keyword_matcher(keywords):
+    keywords = [k.lower() for k in keywords]
+    if not AHOCORASICK_AVAILABLE:
+        return lambda text: any(k in text for k in keywords)
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return lambda text: next(automaton.iter(text), None) is not None
+
+# Link keywords (lowercase); subpages match on text or href, PDFs on link text
+SUBPAGE_KWS = ('about', 'history', 'our story', 'founding', 'contact')
+PDF_KWS = ('report', 'history', 'founded', 'annual')
+SUBPAGE_MATCHER = keyword_matcher(SUBPAGE_KWS)
+PDF_MATCHER = keyword_matcher(PDF_KWS)
+
+# (href, text) per <a href>; selectolax when raw markup is available
+def iter_links(soup, html=None):
+    if html is not None and SELECTOLAX_AVAILABLE:
+        for node in HTMLParser(html).css('a[href]'):
+            yield node.attributes.get('href') or '', node.text(strip=True)
+    else:
+        for a in soup.find_all('a', href=True):
+            yield a['href'], a.get_text(strip=True)
+
+def find_subpages_and_pdfs(soup, base_url, html=None):
+    # dicts as ordered sets: de-duplicated (subpages by normalized URL), in page order
+    subpages = {}
+    pdfs = {}
+    base_key = normalize_url(base_url)
+
+    for href, text in iter_links(soup, html):
+        text = text.lower()
+        href_lc = href.lower()
         full_url = urljoin(base_url, href)
 
         # Subpages
-        if any(k in text or k in href.lower() for k in ['about', 'history', 'our story', 'founding', 'contact']):
-            if full_url != base_url and '#' not in full_url:
-                subpages.append(full_url)
+        if SUBPAGE_MATCHER(text + ' ' + href_lc):
+            if normalize_url(full_url) != base_key and '#' not in full_url:
+                subpages.setdefault(normalize_url(full_url), full_url)
 
         # PDFs
-        if href.lower().endswith('.pdf') and any(k in text for k in ['report', 'history', 'founded', 'annual']):
-            pdfs.append(full_url)
+        if href_lc.endswith('.pdf') and PDF_MATCHER(text):
+            pdfs.setdefault(full_url, None)
 
-    return list(set(subpages)), list(set(pdfs))
+    return list(subpages.values()), list(pdfs)
 
 # === 5. EXTRACTION FUNCTIONS ===
+# Custom and scope selectors are compiled once and reused on every page
+@lru_cache(maxsize=256)
+def compile_selector(selector):
+    return soupsieve.compile(selector)
+
 def extract_ngo_name(soup, custom=None):
     if custom:
-        e = soup.select_one(custom)
+        e = compile_selector(custom).select_one(soup)
         if e: return e.get_text(strip=True)
     return soup.title.string.strip() if soup.title else None
 
-def extract_year_founded(soup, custom=None):
+# Where each field usually sits; the full text is only searched when none exist
+YEAR_SCOPE = 'main, article, section, footer, [class*="about"], [id*="about"]'
+CONTACT_SCOPE = 'footer, [class*="contact"], [id*="contact"], address'
+
+# Text of the outermost selector matches; the whole page only when nothing matches
+def scoped_text(soup, selector, text=None):
+    nodes = compile_selector(selector).select(soup)
+    selected = {id(n) for n in nodes}
+    outermost = [n for n in nodes if not any(id(p) in selected for p in n.parents)]
+    if outermost:
+        return ' '.join(n.get_text() for n in outermost)
+    return text if text is not None else soup.get_text()
+
+# `text` is the page's soup.get_text(), computed once by the caller (or here if omitted)
+def extract_year_founded(soup, text=None, custom=None):
     if custom:
-        e = soup.select_one(custom)
+        e = compile_selector(custom).select_one(soup)
         if e: 
-            m = re.search(r'\b(19|20)\d{2}\b', e.get_text())
+            m = YEAR_RE.search(e.get_text())
             if m: return m.group(0)
-    text = soup.get_text()
-    patterns = [
-        r'(?:founded|established|started|since)\s*(?:in)?\s*(19|20)\d{2}',
-        r'\b(19|20)\d{2}\s*(?:founded|established)'
-    ]
-    for p in patterns:
-        m = re.search(p, text, re.I)
+    scope = scoped_text(soup, YEAR_SCOPE, text)
+    for p in YEAR_PATTERNS:
+        m = p.search(scope)
         if m: return m.group(1) if m.group(1) else m.group(0)
     return None
 
-def extract_fields_of_work(soup, custom=None):
+def extract_fields_of_work(soup, text=None, custom=None):
     if custom:
-        elems = soup.select(custom)
+        elems = compile_selector(custom).select(soup)
         return [e.get_text(strip=True) for e in elems if e.get_text(strip=True)]
     
-    # Look for program lists
-    keywords = ['program', 'initiative', 'project', 'work', 'focus']
-    for kw in keywords:
-        sec = soup.find(string=re.compile(kw, re.I))
-        if sec:
-            parent = sec.find_parent(['div', 'section', 'article'])
-            if parent:
-                ul = parent.find('ul') or parent.find('ol')
-                if ul:
-                    items = [li.get_text(strip=True) for li in ul.find_all('li')]
-                    if len(items) >= 2:
-                        return items
+    # Look for program lists (the tree is only walked when the page text has a keyword)
+    if text is None:
+        text = soup.get_text()
+    if not FIELDS_SECTION_RE.search(text):
+        return []
+    # First few hits only; a shared parent is searched once
+    tried = set()
+    for sec in soup.find_all(string=FIELDS_SECTION_RE, limit=5):
+        parent = sec.find_parent(['div', 'section', 'article'])
+        if parent and id(parent) not in tried:
+            tried.add(id(parent))
+            ul = parent.find('ul') or parent.find('ol')
+            if ul:
+                items = [li.get_text(strip=True) for li in ul.find_all('li')]
+                if len(items) >= 2:
+                    return items
     return []
 
-def extract_operational_areas(soup, custom=None):
+def extract_operational_areas(soup, text=None, custom=None):
     if custom:
-        elems = soup.select(custom)
+        elems = compile_selector(custom).select(soup)
         return [e.get_text(strip=True) for e in elems if e.get_text(strip=True)]
     
-    text = soup.get_text()
-    countries = re.findall(r'\b(India|Delhi|Mumbai|Pune|Odisha|Maharashtra|Karnataka|Tamil Nadu|USA|UK|Africa|Asia)\b', text, re.I)
+    if text is None:
+        text = soup.get_text()
+    countries = COUNTRY_RE.findall(text)
     return list(set(countries)) if countries else []
 
-def extract_contact_info(soup, custom=None):
+def extract_contact_info(soup, text=None, custom=None):
     contact = {}
-    text = soup.get_text()
-    
-    email = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
+    scope = scoped_text(soup, CONTACT_SCOPE, text)
+    email = EMAIL_RE.search(scope)
     if email: contact['email'] = email.group(0)
     
-    phone = re.search(r'[\+]?[\d\s\-\(\)]{10,}', text)
+    phone = PHONE_RE.search(scope)
     if phone: contact['phone'] = phone.group(0)
     
     return contact if contact else None
@@ -206,11 +504,12 @@ def extract_contact_info(soup, custom=None):
 def parse_ngo(url, use_playwright=False, customs=None):
     if customs is None:
         customs = {}
-    domain = urlparse(url).netloc
+    domain = get_domain(url)
     custom = customs.get(domain, {})
 
     print(f"\nScraping: {url}")
-    soup = fetch_page(url, use_playwright)
+    cache = {}  # pages of this NGO only, released when parse_ngo returns
+    soup, html = fetch_page_and_markup(url, use_playwright, cache)
     if not soup:
         return None
 
@@ -227,39 +526,44 @@ def parse_ngo(url, use_playwright=False, customs=None):
     json_data = extract_from_json_ld(soup)
     data.update(json_data)
 
-    # 2. Main page extraction
+    # 2. Main page extraction (page text computed once, shared by all extractors)
+    page_text = soup.get_text()
     data['ngo_name'] = data['ngo_name'] or extract_ngo_name(soup, custom.get('ngo_name'))
-    data['year_founded'] = data['year_founded'] or extract_year_founded(soup, custom.get('year_founded'))
-    data['fields_of_work'] = data['fields_of_work'] or extract_fields_of_work(soup, custom.get('fields_of_work'))
-    data['operational_areas'] = data['operational_areas'] or extract_operational_areas(soup, custom.get('operational_areas'))
-    data['contact_info'] = data['contact_info'] or extract_contact_info(soup, custom.get('contact_info'))
-
-    # 3. Subpages
-    subpages, pdfs = find_subpages_and_pdfs(soup, url)
-    for sub_url in subpages[:2]:  # limit to 2
-        time.sleep(1)
-        sub_soup = fetch_page(sub_url, use_playwright)
-        if sub_soup:
-            # Update year
-            if not data['year_founded']:
-                data['year_founded'] = extract_year_founded(sub_soup, custom.get('year_founded'))
-            
-            # Update fields of work
-            if not data['fields_of_work']:
-                data['fields_of_work'] = extract_fields_of_work(sub_soup, custom.get('fields_of_work'))
-            
-            # Update contact info
-            if not data['contact_info'] or not data['contact_info'].get('email'):
-                new_contact = extract_contact_info(sub_soup, custom.get('contact_info'))
-                if new_contact:
-                    data['contact_info'].update(new_contact)
-
-    # 4. PDFs
-    for pdf_url in pdfs[:1]:
-        time.sleep(1)
-        pdf_data = extract_from_pdf(pdf_url)
-        if pdf_data.get('year_founded') and not data['year_founded']:
-            data['year_founded'] = pdf_data['year_founded']
+    data['year_founded'] = data['year_founded'] or extract_year_founded(soup, page_text, custom.get('year_founded'))
+    data['fields_of_work'] = data['fields_of_work'] or extract_fields_of_work(soup, page_text, custom.get('fields_of_work'))
+    data['operational_areas'] = data['operational_areas'] or extract_operational_areas(soup, page_text, custom.get('operational_areas'))
+    data['contact_info'] = data['contact_info'] or extract_contact_info(soup, page_text, custom.get('contact_info'))
+
+    # 3 & 4. Subpages and PDFs are independent, so all of them are fetched at once
+    subpages, pdfs = find_subpages_and_pdfs(soup, url, html)
+    sub_urls = subpages[:2]  # limit to 2
+    with ThreadPoolExecutor(max_workers=len(sub_urls) + 1) as ex:
+        pdf_futures = [ex.submit(extract_from_pdf, pdf_url) for pdf_url in pdfs[:1]]
+
+        # 3. Subpages
+        for sub_soup in ex.map(lambda u: fetch_page(u, use_playwright, cache), sub_urls):
+            if sub_soup:
+                sub_text = sub_soup.get_text()
+
+                # Update year
+                if not data['year_founded']:
+                    data['year_founded'] = extract_year_founded(sub_soup, sub_text, custom.get('year_founded'))
+                
+                # Update fields of work
+                if not data['fields_of_work']:
+                    data['fields_of_work'] = extract_fields_of_work(sub_soup, sub_text, custom.get('fields_of_work'))
+                
+                # Update contact info
+                if not data['contact_info'] or not data['contact_info'].get('email'):
+                    new_contact = extract_contact_info(sub_soup, sub_text, custom.get('contact_info'))
+                    if new_contact:
+                        data['contact_info'].update(new_contact)
+
+        # 4. PDFs
+        for future in pdf_futures:
+            pdf_data = future.result()
+            if pdf_data.get('year_founded') and not data['year_founded']:
+                data['year_founded'] = pdf_data['year_founded']
 
     return data
 
@@ -268,6 +572,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="NGO Scraper v3 – Playwright + JSON-LD + PDF")
     parser.add_argument('urls', nargs='+', help="NGO websites")
     parser.add_argument('--use-playwright', action='store_true', help="Use Playwright for JS sites")
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS, help="Number of sites scraped in parallel")
     args = parser.parse_args()
 
     if args.use_playwright and not PLAYWRIGHT_AVAILABLE:
@@ -276,12 +581,21 @@ if __name__ == "__main__":
 
     customs = load_custom_selectors()
 
-    for url in args.urls:
-        result = parse_ngo(url, args.use_playwright, customs)
-        if result:
-            domain = urlparse(url).netloc.replace('www.', '')
-            filename = f"versions/v3/{domain}.json"
-            os.makedirs("versions/v3", exist_ok=True)
-            with open(filename, 'w') as f:
-                json.dump(result, f, indent=4)
-            print(f"Saved: {filename}")
+    os.makedirs("versions/v3", exist_ok=True)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(args.workers, len(args.urls)))) as ex:
+            futures = {ex.submit(parse_ngo, url, args.use_playwright, customs): url for url in args.urls}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"Failed: {url} ({e})")
+                    continue
+                if result:
+                    domain = get_domain(url).replace('www.', '')
+                    filename = f"versions/v3/{domain}.json"
+                    write_json(result, filename)
+                    print(f"Saved: {filename}")
+    finally:
+        shutdown_browser()
@@ -2,15 +2,29 @@
 # v3 – India-Specific, Clean Output, Interactive-Aware
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import soupsieve
+from lxml import etree, html as lxml_html
 import json
 import re
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse, urljoin, urlsplit, urlunsplit
 import os
 import argparse
+import threading
 import time
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice, zip_longest
+from types import MappingProxyType
+from contextlib import contextmanager
 import pdfplumber
-import tempfile
+from pdfplumber.page import Page
+from pdfminer.pdfpage import PDFPage
+import io
+import shutil
 
 # Playwright
 try:
@@ -19,8 +33,94 @@ try:
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+# selectolax (optional, fast C parser for the link scan)
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# pyahocorasick (optional, one-pass multi-keyword matching)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# orjson (optional, faster JSON encode/decode)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# diskcache (optional, on-disk page cache so re-runs skip the network)
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
 CUSTOM_FILE = 'custom_selectors.json'
 
+# Shared HTTP session: keep-alive + connection pooling across page, subpage and PDF fetches
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': 'Mozilla/5.0'})
+
+# Big pages go to lxml as bytes (libxml2 decodes them)
+LARGE_PAGE_BYTES = 1_000_000
+# Bodies are truncated here before parsing
+MAX_PAGE_BYTES = 2_000_000
+
+# Parallel sites, but only a couple of requests per host at a time
+MAX_WORKERS = 16
+HOST_CONCURRENCY = 2
+HOST_RATE = 2.0  # requests per second per host, in bursts of up to HOST_CONCURRENCY
+
+# Connection pools sized from the limits above
+_adapter = HTTPAdapter(pool_connections=2 * MAX_WORKERS, pool_maxsize=HOST_CONCURRENCY,
+                       max_retries=Retry(total=2, backoff_factor=0.3))
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+_host_next_slot = {}
+_host_rate_lock = threading.Lock()
+
+# netloc of a URL (cached, looked up for every fetch)
+@lru_cache(maxsize=1024)
+def get_domain(url):
+    return urlparse(url).netloc
+
+# Per-host semaphore, created on first use
+def host_semaphore(url):
+    host = get_domain(url)
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(HOST_CONCURRENCY)
+        return _host_semaphores[host]
+
+# Sleep until the host's next HOST_RATE slot is due
+def wait_for_host_rate(url):
+    host = get_domain(url)
+    interval = 1.0 / HOST_RATE
+    with _host_rate_lock:
+        now = time.monotonic()
+        # HOST_CONCURRENCY requests may go out ahead of the schedule
+        slot = max(_host_next_slot.get(host, now), now)
+        delay = slot - now - (HOST_CONCURRENCY - 1) * interval
+        _host_next_slot[host] = slot + interval
+    if delay > 0:
+        time.sleep(delay)
+
+# Wrap every request to a host: concurrency cap + rate limit
+@contextmanager
+def host_slot(url):
+    with host_semaphore(url):
+        wait_for_host_rate(url)
+        yield
+
 # Indian states & major cities
 INDIAN_STATES = [
     'Delhi', 'Mumbai', 'Pune', 'Bangalore', 'Kolkata', 'Chennai', 'Hyderabad',
@@ -30,46 +130,221 @@ INDIAN_STATES = [
     'Madhya Pradesh', 'West Bengal', 'Telangana', 'Andhra Pradesh'
 ]
 
+# Regexes, compiled at import
+YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+YEAR_AFTER_KEYWORD_RE = re.compile(r'(?:founded|established|since)\s*(?:in)?\s*\b((?:19|20)\d{2})\b', re.I)
+# Fallback when no keyword precedes the year ("1994 ... founded")
+YEAR_BEFORE_KEYWORD_RE = re.compile(r'\b((?:19|20)\d{2})\b.*?(?:founded|established)', re.I)
+PDF_YEAR_RE = re.compile(r'(?:founded|established|since)\s*(?:in)?\s*(\d{4})', re.I)
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+PHONE_PATTERNS = (
+    re.compile(r'\+91[\s\-]?\d{10}'),
+    re.compile(r'91[\s\-]?\d{10}'),
+    re.compile(r'0\d{2,3}[\s\-]?\d{7,8}'),
+    re.compile(r'\d{2,3}[\s\-]?\d{7,8}'),
+    re.compile(r'P[\s:]*\+?91[\s\-]?\d{10}'),
+    re.compile(r'Contact[\s:]*\+?91[\s\-]?\d{10}')
+)
+NON_PHONE_CHARS_RE = re.compile(r'[^\d+]')
+SELECT_STATE_RE = re.compile('select state', re.I)
+# All states in one alternation, matched against lowercased page text
+STATES_RE = re.compile(r'\b(' + '|'.join(re.escape(s.lower()) for s in INDIAN_STATES) + r')\b')
+# With pyahocorasick, one automaton pass finds every state; word boundaries are checked per hit
+STATES_AC = None
+if AHOCORASICK_AVAILABLE:
+    STATES_AC = ahocorasick.Automaton()
+    for state in INDIAN_STATES:
+        STATES_AC.add_word(state.lower(), state.lower())
+    STATES_AC.make_automaton()
+
+# Program-list keywords, matched together in one pass (case-insensitive)
+FIELDS_KEYWORDS = ('program', 'initiative', 'project', 'focus', 'work')
+FIELDS_SECTION_RE = re.compile('|'.join(FIELDS_KEYWORDS), re.I)
+HIDDEN_TAGS = ('script', 'style', 'noscript')
+# Compiled XPaths (run on the lxml tree): the nearest div/section/article around a
+# keyword hit, then the first list inside or after it
+FIELDS_SECTION_XPATH = etree.XPath("ancestor-or-self::*[self::div or self::section or self::article][1]")
+FIELDS_LIST_XPATH = etree.XPath("(descendant::*[self::ul or self::ol] | following::*[self::ul or self::ol])[1]")
+
+def json_loads(data):
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def write_json(obj, filename):
+    if ORJSON_AVAILABLE:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w') as f:
+            f.write(json.dumps(obj, indent=2))
+
+# Read once per run (parse_ngo looks selectors up for every URL); saving invalidates
+@lru_cache(maxsize=1)
 def load_custom_selectors():
     if os.path.exists(CUSTOM_FILE):
         try:
-            with open(CUSTOM_FILE, 'r') as f:
-                return json.load(f)
+            with open(CUSTOM_FILE, 'rb') as f:
+                return json_loads(f.read())
         except:
             return {}
     return {}
 
 def save_custom_selectors(customs):
-    with open(CUSTOM_FILE, 'w') as f:
-        json.dump(customs, f, indent=4)
+    write_json(customs, CUSTOM_FILE)
+    load_custom_selectors.cache_clear()
+    custom_selectors_for.cache_clear()
+
+# Per-domain selectors, compiled once (compile_selector passes compiled patterns through)
+@lru_cache(maxsize=None)
+def custom_selectors_for(domain):
+    return MappingProxyType({field: compile_selector(sel) if isinstance(sel, str) else sel
+                             for field, sel in load_custom_selectors().get(domain, {}).items()})
 
 # === FETCH ===
-def fetch_page(url, use_playwright=False):
+# Dedup/cache key: lowercase scheme/host, no fragment or trailing slash
+def normalize_url(url):
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), parts.query, ''))
+
+def fetch_page(url, use_playwright=False, cache=None):
+    return fetch_page_and_markup(url, use_playwright, cache)[0]
+
+# Returns (soup, raw markup); the markup feeds the selectolax link scan.
+# cache is a dict owned by one NGO's parse_ngo; failed fetches are not stored
+def fetch_page_and_markup(url, use_playwright=False, cache=None):
+    key = normalize_url(url)
+    if cache is not None and key in cache:
+        return cache[key]
+    page = download_page(url, use_playwright)
+    if cache is not None and page[0] is not None:
+        cache[key] = page
+    return page
+
+# Playwright objects are tied to the thread that created them, so each browser is
+# owned by its own dedicated thread for the whole run; a queue of idle threads caps
+# how many pages render at once (one fresh context per page)
+PLAYWRIGHT_BROWSERS = 2
+_playwright_threads = [ThreadPoolExecutor(max_workers=1, thread_name_prefix='playwright')
+                       for _ in range(PLAYWRIGHT_BROWSERS)]
+_idle_playwright_threads = queue.Queue()
+for _thread in _playwright_threads:
+    _idle_playwright_threads.put(_thread)
+_playwright_local = threading.local()
+
+def _render(url):
+    local = _playwright_local
+    if getattr(local, 'browser', None) is None:
+        local.playwright = sync_playwright().start()
+        local.browser = local.playwright.chromium.launch(headless=True)
+    context = local.browser.new_context()
+    try:
+        page = context.new_page()
+        page.goto(url, wait_until="domcontentloaded", timeout=15000)
+        try:
+            page.wait_for_selector('main, article, #content, footer', timeout=3000)
+        except Exception:
+            pass
+        return page.content()
+    finally:
+        context.close()
+
+def _close_browser():
+    local = _playwright_local
+    if getattr(local, 'browser', None) is not None:
+        local.browser.close()
+        local.playwright.stop()
+        local.browser = local.playwright = None
+
+# Render on the next idle browser thread; blocks while all are busy
+def render_page(url):
+    thread = _idle_playwright_threads.get()
+    try:
+        return thread.submit(_render, url).result()
+    finally:
+        _idle_playwright_threads.put(thread)
+
+# Close every started browser on its own thread, then stop the threads
+def shutdown_browser():
+    for thread in _playwright_threads:
+        thread.submit(_close_browser).result()
+        thread.shutdown()
+
+# Body capped at MAX_PAGE_BYTES; bytes if large or charset-less, so lxml decodes it
+def read_markup(response):
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=65536):
+        body += chunk
+        if len(body) >= MAX_PAGE_BYTES:
+            del body[MAX_PAGE_BYTES:]
+            break
+    body = bytes(body)
+    if len(body) > LARGE_PAGE_BYTES or 'charset' not in response.headers.get('Content-Type', '').lower():
+        return body
+    try:
+        return body.decode(response.encoding, errors='replace')
+    except LookupError:
+        return body
+
+# On-disk cache of fetched markup, off unless enabled (--cache-dir)
+PAGE_CACHE_TTL = 24 * 3600
+_disk_cache = None
+
+# Switch on the on-disk markup cache (entries live PAGE_CACHE_TTL seconds)
+def enable_disk_cache(directory):
+    global _disk_cache
+    _disk_cache = diskcache.Cache(directory)
+
+def fetch_markup(url):
+    # Raw markup of url (None on a non-200), from the disk cache when enabled
+    key = normalize_url(url)
+    if _disk_cache is not None:
+        markup = _disk_cache.get(key)
+        if markup is not None:
+            return markup
+    with host_slot(url), SESSION.get(url, stream=True, timeout=15) as r:
+        if r.status_code != 200:
+            return None
+        markup = read_markup(r)
+    if _disk_cache is not None:
+        _disk_cache.set(key, markup, expire=PAGE_CACHE_TTL)
+    return markup
+
+def download_page(url, use_playwright=False):
     if use_playwright and PLAYWRIGHT_AVAILABLE:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until="networkidle", timeout=30000)
-            html = page.content()
-            browser.close()
-            return BeautifulSoup(html, 'html.parser')
+        try:
+            with host_slot(url):
+                html = render_page(url)
+            return BeautifulSoup(html, 'lxml'), html
+        except:
+            return None, None
     else:
-        headers = {'User-Agent': 'Mozilla/5.0'}
         try:
-            r = requests.get(url, headers=headers, timeout=15)
-            return BeautifulSoup(r.text, 'html.parser') if r.status_code == 200 else None
+            markup = fetch_markup(url)
+            if markup is None:
+                return None, None
+            return BeautifulSoup(markup, 'lxml'), markup
         except:
-            return None
+            return None, None
 
 # === JSON-LD ===
+ORG_TYPES = frozenset({'NGO', 'Organization', 'Nonprofit', 'NonprofitOrganization'})
+# Every organization @type contains one of these, so scripts without them can skip json parsing
+ORG_HINT_RE = re.compile(r'NGO|Organization|Nonprofit')
+
+def is_org(item):
+    types = item.get('@type')
+    types = types if isinstance(types, list) else [types]
+    return not ORG_TYPES.isdisjoint(types)
+
 def extract_from_json_ld(soup):
     data = {}
     for script in soup.find_all('script', type='application/ld+json'):
+        if not script.string or not ORG_HINT_RE.search(script.string):
+            continue
         try:
-            obj = json.loads(script.string)
+            obj = json_loads(script.string)
             items = obj if isinstance(obj, list) else [obj]
             for item in items:
-                if item.get('@type') in ['Organization', 'NGO']:
+                if is_org(item):
                     if 'foundingDate' in item:
                         data['year_founded'] = item['foundingDate'][:4]
                     if 'name' in item:
@@ -83,126 +358,263 @@ def extract_from_json_ld(soup):
     return data
 
 # === PDF ===
+# Reports usually state the founding year early: fetch the head first, the rest only on a miss
+PDF_HEAD_BYTES = 512 * 1024
+PDF_MAX_PAGES = 10
+
+def download_pdf(pdf_url, buf, first_byte=0, last_byte=''):
+    # Stream a byte range into buf (no temp file); True once buf holds the whole file, None on failure
+    headers = {'Range': f'bytes={first_byte}-{last_byte}', 'Accept-Encoding': 'identity'}
+    with host_slot(pdf_url), SESSION.get(pdf_url, headers=headers, stream=True, timeout=15) as r:
+        if r.status_code == 200:  # Range ignored, this is the whole file
+            first_byte = 0
+        elif r.status_code != 206:
+            return None
+        buf.seek(first_byte)
+        buf.truncate()
+        r.raw.decode_content = True
+        shutil.copyfileobj(r.raw, buf)
+        total = r.headers.get('Content-Range', '').rpartition('/')[2]
+        return r.status_code == 200 or (total.isdigit() and buf.tell() >= int(total))
+
+def scan_pdf(buf, texts):
+    # Stop parsing at the first page with a year; resumes after the pages in texts, up to PDF_MAX_PAGES.
+    # Pages are created lazily, so a cut-off head still yields the pages it holds
+    buf.seek(0)
+    with pdfplumber.open(buf) as pdf:
+        page_objs = islice(PDFPage.create_pages(pdf.doc), len(texts), PDF_MAX_PAGES)
+        for number, page_obj in enumerate(page_objs, len(texts) + 1):
+            texts.append(Page(pdf, page_obj, page_number=number).extract_text() or "")
+            m = PDF_YEAR_RE.search(texts[-1])
+            if m: return m
+    return PDF_YEAR_RE.search("".join(texts))  # phrase split across pages
+
 def extract_from_pdf(pdf_url):
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as f:
-            r = requests.get(pdf_url, timeout=15)
-            if r.status_code != 200: return {}
-            f.write(r.content)
-            path = f.name
-        text = ""
-        with pdfplumber.open(path) as pdf:
-            for page in pdf.pages:
-                text += page.extract_text() or ""
-        os.unlink(path)
-        m = re.search(r'(?:founded|established|since)\s*(?:in)?\s*(\d{4})', text, re.I)
+        buf = io.BytesIO()
+        complete = download_pdf(pdf_url, buf, 0, PDF_HEAD_BYTES - 1)
+        if complete is None: return {}
+        texts = []  # page texts scanned so far
+        try:
+            m = scan_pdf(buf, texts)
+        except:
+            m = None  # a cut-off head may not parse on its own
+        if not m and not complete:
+            del texts[-1:]  # last head page may be cut off: read it again
+            if len(texts) < PDF_MAX_PAGES:
+                if download_pdf(pdf_url, buf, PDF_HEAD_BYTES) is None: return {}
+                m = scan_pdf(buf, texts)
         return {'year_founded': m.group(1)} if m else {}
     except:
         return {}
 
 # === SUBPAGE & PDF FINDER ===
-def find_subpages_and_pdfs(soup, base_url):
-    subpages = []
-    pdfs = []
-    for a in soup.find_all('a', href=True):
-        href = a['href']
-        text = a.get_text(strip=True).lower()
+# One-scan "any keyword in lowercased text?" check (Aho-Corasick if installed)
+def keyword_matcher(keywords):
+    keywords = [k.lower() for k in keywords]
+    if not AHOCORASICK_AVAILABLE:
+        return lambda text: any(k in text for k in keywords)
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return lambda text: next(automaton.iter(text), None) is not None
+
+# Link keywords (lowercase); subpages match on text or href, PDFs on link text
+SUBPAGE_KWS = ('about', 'history', 'contact', 'team', 'state')
+PDF_KWS = ('report', 'annual')
+SUBPAGE_MATCHER = keyword_matcher(SUBPAGE_KWS)
+PDF_MATCHER = keyword_matcher(PDF_KWS)
+
+# (href, text) per <a href>; selectolax when raw markup is available
+def iter_links(soup, html=None):
+    if html is not None and SELECTOLAX_AVAILABLE:
+        for node in HTMLParser(html).css('a[href]'):
+            yield node.attributes.get('href') or '', node.text(strip=True)
+    else:
+        for a in soup.find_all('a', href=True):
+            yield a['href'], a.get_text(strip=True)
+
+def find_subpages_and_pdfs(soup, base_url, html=None):
+    # dicts as ordered sets: de-duplicated (subpages by normalized URL), in page order
+    subpages = {}
+    pdfs = {}
+    base_key = normalize_url(base_url)
+    for href, text in iter_links(soup, html):
+        text = text.lower()
+        href_lc = href.lower()
         full = urljoin(base_url, href)
-        if any(k in text or k in href.lower() for k in ['about', 'history', 'contact', 'team', 'state']):
-            if full != base_url and '#' not in full:
-                subpages.append(full)
-        if href.lower().endswith('.pdf') and any(k in text for k in ['report', 'annual']):
-            pdfs.append(full)
-    return list(set(subpages)), list(set(pdfs))
+        if SUBPAGE_MATCHER(text + ' ' + href_lc):
+            if normalize_url(full) != base_key and '#' not in full:
+                subpages.setdefault(normalize_url(full), full)
+        if href_lc.endswith('.pdf') and PDF_MATCHER(text):
+            pdfs.setdefault(full, None)
+    return list(subpages.values()), list(pdfs)
 
 # === EXTRACTORS ===
+# Custom and scope selectors are compiled once and reused on every page
+@lru_cache(maxsize=256)
+def compile_selector(selector):
+    return soupsieve.compile(selector)
+
 def extract_ngo_name(soup, custom=None):
     if custom:
-        e = soup.select_one(custom)
+        e = compile_selector(custom).select_one(soup)
         if e: return e.get_text(strip=True)
     return soup.title.string.strip() if soup.title and soup.title.string else None
 
-def extract_year_founded(soup, custom=None):
+# Literal anchors of the year patterns, searched case-insensitively (no lowercased copy of the text)
+YEAR_KW_RE = re.compile(r'founded|established|since', re.I)
+FIELDS_MATCHER = keyword_matcher(FIELDS_KEYWORDS)
+# Where each field usually sits; the full text is only searched when none exist
+YEAR_SCOPE = 'main, article, section, footer, [class*="about"], [id*="about"]'
+CONTACT_SCOPE = 'footer, [class*="contact"], [id*="contact"], address'
+
+# First plausible phone, trying PHONE_PATTERNS in priority order
+def find_phone(text):
+    for p in PHONE_PATTERNS:
+        m = p.search(text)
+        if m:
+            phone = NON_PHONE_CHARS_RE.sub('', m.group(0))
+            if len(phone) >= 10:
+                return phone
+    return None
+
+# Text of the outermost selector matches; the whole page only when nothing matches
+def scoped_text(soup, selector, text=None):
+    nodes = compile_selector(selector).select(soup)
+    selected = {id(n) for n in nodes}
+    outermost = [n for n in nodes if not any(id(p) in selected for p in n.parents)]
+    if outermost:
+        return ' '.join(n.get_text() for n in outermost)
+    return text if text is not None else soup.get_text()
+
+# `text` is the page's soup.get_text(), computed once by the caller (or here if omitted)
+def extract_year_founded(soup, text=None, custom=None):
     if custom:
-        e = soup.select_one(custom)
+        e = compile_selector(custom).select_one(soup)
         if e:
-            m = re.search(r'\b(19|20)\d{2}\b', e.get_text())
+            m = YEAR_RE.search(e.get_text())
             if m: return m.group(0)
-    text = soup.get_text()
-    patterns = [
-        r'(?:founded|established|since)\s*(?:in)?\s*\b(19|20)\d{2}\b',
-        r'\b(19|20)\d{2}\b.*?(?:founded|established)'
-    ]
-    for p in patterns:
-        m = re.search(p, text, re.I)
-        if m: return m.group(1) if m.group(1) else m.group(0)
+    scope = scoped_text(soup, YEAR_SCOPE, text)
+    # Both patterns need a founding keyword, so a page without one is skipped
+    if YEAR_KW_RE.search(scope):
+        for p in (YEAR_AFTER_KEYWORD_RE, YEAR_BEFORE_KEYWORD_RE):
+            m = p.search(scope)
+            if m: return m.group(1)
     return None
 
-def extract_fields_of_work(soup, custom=None):
+# lxml tree of the raw markup for the XPath lookups (None if unparsable)
+def html_tree(markup):
+    try:
+        try:
+            return lxml_html.document_fromstring(markup)
+        except ValueError:  # str carrying an XML encoding declaration
+            return lxml_html.document_fromstring(markup.encode('utf-8'))
+    except:
+        return None
+
+# Elements holding the first `limit` body text strings that match regex (script/style skipped)
+def keyword_text_parents(tree, regex, limit):
+    body = tree.find('body')
+    if body is None:
+        return
+    for el in body.iter():
+        # Comments have a non-string tag; their own text is never shown
+        if isinstance(el.tag, str) and el.tag not in HIDDEN_TAGS and el.text and regex.search(el.text):
+            yield el
+            limit -= 1
+            if not limit: return
+        # A tail string sits inside its element's parent, not the element itself
+        if el is not body and el.tail and regex.search(el.tail):
+            yield el.getparent()
+            limit -= 1
+            if not limit: return
+
+# `html` is the page's raw markup (falls back to re-serializing the soup); `text_lc` the
+# lowercased page text, passed in when the caller already has it
+def extract_fields_of_work(soup, text=None, custom=None, html=None, text_lc=None):
     if custom:
-        return [e.get_text(strip=True) for e in soup.select(custom)]
-    keywords = ['program', 'initiative', 'project', 'focus', 'work']
-    for kw in keywords:
-        sec = soup.find(string=re.compile(kw, re.I))
-        if sec:
-            parent = sec.find_parent(['div', 'section', 'article'])
-            if parent:
-                ul = parent.find_next(['ul', 'ol'])
-                if ul:
-                    items = [li.get_text(strip=True) for li in ul.find_all('li')]
-                    if len(items) >= 2 and not any('about' in i.lower() for i in items):
-                        return items
+        return [e.get_text(strip=True) for e in compile_selector(custom).select(soup)]
+    if text_lc is None:
+        text_lc = (text if text is not None else soup.get_text()).lower()
+    # Only parse the markup when the page text contains a keyword at all
+    if not FIELDS_MATCHER(text_lc):
+        return []
+    tree = html_tree(html if html is not None else str(soup))
+    if tree is None:
+        return []
+    for el in keyword_text_parents(tree, FIELDS_SECTION_RE, 5):
+        for parent in FIELDS_SECTION_XPATH(el):
+            lists = FIELDS_LIST_XPATH(parent)
+            if lists:
+                items = [''.join(s.strip() for s in li.itertext()) for li in lists[0].iter('li')]
+                if len(items) >= 2 and not any('about' in i.lower() for i in items):
+                    return items
     return []
 
-def extract_operational_areas(soup, custom=None):
+# Same test as \b...\b around text[start:end]
+def word_bounded(text, start, end):
+    before = text[start - 1] if start > 0 else ' '
+    after = text[end] if end < len(text) else ' '
+    return not (before.isalnum() or before == '_' or after.isalnum() or after == '_')
+
+def extract_operational_areas(soup, text=None, custom=None, text_lc=None):
     if custom:
-        return [e.get_text(strip=True) for e in soup.select(custom)]
-    text = soup.get_text()
-    found = []
-    for state in INDIAN_STATES:
-        if re.search(r'\b' + state + r'\b', text, re.I):
-            found.append(state)
-    return found
+        return [e.get_text(strip=True) for e in compile_selector(custom).select(soup)]
+    if text_lc is None:
+        text_lc = (text if text is not None else soup.get_text()).lower()
+    if STATES_AC is not None:
+        matched = {s for end, s in STATES_AC.iter(text_lc) if word_bounded(text_lc, end - len(s) + 1, end + 1)}
+    else:
+        matched = set(STATES_RE.findall(text_lc))
+    return [state for state in INDIAN_STATES if state.lower() in matched]
 
-def extract_contact_info(soup, custom=None):
+def extract_contact_info(soup, text=None, custom=None):
     contact = {}
-    text = soup.get_text()
-
-    # Email
-    email = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
+    scope = scoped_text(soup, CONTACT_SCOPE, text)
+    # Email (only searched when the text has an '@')
+    email = EMAIL_RE.search(scope) if '@' in scope else None
     if email:
         contact['email'] = email.group(0)
 
     # Indian phone patterns
-    phone_patterns = [
-        r'\+91[\s\-]?\d{10}',
-        r'91[\s\-]?\d{10}',
-        r'0\d{2,3}[\s\-]?\d{7,8}',
-        r'\d{2,3}[\s\-]?\d{7,8}',
-        r'P[\s:]*\+?91[\s\-]?\d{10}',
-        r'Contact[\s:]*\+?91[\s\-]?\d{10}'
-    ]
-    for p in phone_patterns:
-        m = re.search(p, text)
-        if m:
-            phone = re.sub(r'[^\d+]', '', m.group(0))
-            if len(phone) >= 10:
-                contact['phone'] = phone
-                break
+    phone = find_phone(scope)
+    if phone:
+        contact['phone'] = phone
 
-    # If no phone and dropdown detected
+    # If no phone and dropdown detected (the prompt is looked up in the page text, not per string node)
     if 'phone' not in contact:
-        if soup.find('select') or soup.find(string=re.compile('select state', re.I)):
+        if text is None:
+            text = soup.get_text()
+        if soup.find('select') or SELECT_STATE_RE.search(text):
             contact['phone'] = 'not found automatically, check manually'
 
     return contact if contact else None
 
 # === MAIN ===
+# Field-driven dispatch: every extractor called as (soup, text, text_lc, html, custom)
+FIELD_EXTRACTORS = {
+    'ngo_name': lambda soup, text, text_lc, html, custom: extract_ngo_name(soup, custom),
+    'year_founded': lambda soup, text, text_lc, html, custom: extract_year_founded(soup, text, custom),
+    'fields_of_work': lambda soup, text, text_lc, html, custom: extract_fields_of_work(soup, text, custom, html, text_lc),
+    'operational_areas': lambda soup, text, text_lc, html, custom: extract_operational_areas(soup, text, custom, text_lc),
+    'contact_info': lambda soup, text, text_lc, html, custom: extract_contact_info(soup, text, custom),
+}
+# Fields retried on about/contact subpages (without the domain's custom selectors)
+SUBPAGE_FIELDS = ('year_founded', 'fields_of_work', 'contact_info')
+
+def field_missing(data, field):
+    # Contact info still counts as missing until a phone number is known
+    if field == 'contact_info':
+        return not data['contact_info'].get('phone')
+    return not data[field]
+
 def parse_ngo(url, use_playwright=False):
-    domain = urlparse(url).netloc
-    custom = load_custom_selectors().get(domain, {})
+    custom = custom_selectors_for(get_domain(url))
 
-    soup = fetch_page(url, use_playwright)
+    cache = {}  # pages of this NGO only, released when parse_ngo returns
+    soup, html = fetch_page_and_markup(url, use_playwright, cache)
     if not soup:
         return None
 
@@ -218,33 +630,43 @@ def parse_ngo(url, use_playwright=False):
     # JSON-LD
     data.update(extract_from_json_ld(soup))
 
-    # Main page
-    data['ngo_name'] = data['ngo_name'] or extract_ngo_name(soup, custom.get('ngo_name'))
-    data['year_founded'] = data['year_founded'] or extract_year_founded(soup, custom.get('year_founded'))
-    data['fields_of_work'] = data['fields_of_work'] or extract_fields_of_work(soup, custom.get('fields_of_work'))
-    data['operational_areas'] = data['operational_areas'] or extract_operational_areas(soup, custom.get('operational_areas'))
-    data['contact_info'] = data['contact_info'] or extract_contact_info(soup, custom.get('contact_info'))
-
-    # Subpages
-    subpages, pdfs = find_subpages_and_pdfs(soup, url)
-    for sub_url in subpages[:2]:
-        time.sleep(1)
-        sub_soup = fetch_page(sub_url, use_playwright)
-        if sub_soup:
-            if not data['year_founded']:
-                data['year_founded'] = extract_year_founded(sub_soup)
-            if not data['fields_of_work']:
-                data['fields_of_work'] = extract_fields_of_work(sub_soup)
-            if not data['contact_info'].get('phone'):
-                new_c = extract_contact_info(sub_soup)
-                if new_c:
-                    data['contact_info'].update(new_c)
-
-    # PDF
-    for pdf_url in pdfs[:1]:
-        pdf_data = extract_from_pdf(pdf_url)
-        if pdf_data.get('year_founded') and not data['year_founded']:
-            data['year_founded'] = pdf_data['year_founded']
+    # Main page: only the fields JSON-LD left empty (page text and its lowercased copy
+    # computed once, shared by all extractors)
+    page_text = soup.get_text()
+    page_lc = page_text.lower()
+    for field, extract in FIELD_EXTRACTORS.items():
+        if not data[field]:
+            data[field] = extract(soup, page_text, page_lc, html, custom.get(field)) or data[field]
+
+    # Subpages and PDF are independent, so all of them are fetched at once,
+    # and only while some field they can fill is still missing
+    missing = [field for field in SUBPAGE_FIELDS if field_missing(data, field)]
+    subpages, pdfs = find_subpages_and_pdfs(soup, url, html)
+    sub_urls = subpages[:2] if missing else []
+    pdf_urls = pdfs[:1] if 'year_founded' in missing else []
+    with ThreadPoolExecutor(max_workers=len(sub_urls) + 1) as ex:
+        pdf_futures = [ex.submit(extract_from_pdf, pdf_url) for pdf_url in pdf_urls]
+
+        # Subpages
+        for sub_soup, sub_html in ex.map(lambda u: fetch_page_and_markup(u, use_playwright, cache), sub_urls):
+            if not sub_soup or not missing:
+                continue
+            sub_text = sub_soup.get_text()
+            for field in list(missing):
+                value = FIELD_EXTRACTORS[field](sub_soup, sub_text, None, sub_html, None)
+                if field == 'contact_info':
+                    if value:
+                        data['contact_info'].update(value)
+                else:
+                    data[field] = value or data[field]
+                if not field_missing(data, field):
+                    missing.remove(field)
+
+        # PDF
+        for future in pdf_futures:
+            pdf_data = future.result()
+            if pdf_data.get('year_founded') and not data['year_founded']:
+                data['year_founded'] = pdf_data['year_founded']
 
     return data
 
@@ -253,17 +675,42 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument('urls', nargs='+')
     parser.add_argument('--use-playwright', action='store_true')
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS)
+    parser.add_argument('--cache-dir')
     args = parser.parse_args()
 
     if args.use_playwright and not PLAYWRIGHT_AVAILABLE:
         print("Install: pip install playwright && playwright install")
         exit(1)
 
-    for url in args.urls:
-        result = parse_ngo(url, args.use_playwright)
-        if result:
-            domain = urlparse(url).netloc.replace('www.', '')
-            os.makedirs("versions/v4", exist_ok=True)
-            with open(f"versions/v4/{domain}.json", 'w') as f:
-                json.dump(result, f, indent=4)
-            print(f"Saved: versions/v4/{domain}.json")
+    if args.cache_dir:
+        if not DISKCACHE_AVAILABLE:
+            print("Install: pip install diskcache")
+            exit(1)
+        enable_disk_cache(args.cache_dir)
+
+    # Group URLs by domain (duplicates dropped), then interleave the groups: workers spread
+    # across hosts instead of queueing on one host's slots. Each worker resolves its domain's
+    # selectors itself (cached per domain), so one bad selector only fails that domain's URLs
+    by_domain = {}
+    for url in dict.fromkeys(args.urls, None):
+        by_domain.setdefault(get_domain(url), []).append(url)
+    urls = [url for batch in zip_longest(*by_domain.values()) for url in batch if url]
+
+    os.makedirs("versions/v4", exist_ok=True)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(args.workers, len(urls)))) as ex:
+            futures = {ex.submit(parse_ngo, url, args.use_playwright): url for url in urls}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"Failed: {url} ({e})")
+                    continue
+                if result:
+                    domain = get_domain(url).replace('www.', '')
+                    write_json(result, f"versions/v4/{domain}.json")
+                    print(f"Saved: versions/v4/{domain}.json")
+    finally:
+        shutdown_browser()